@@ -27,7 +27,7 @@ class CustomConstraint:
         )
 
     @staticmethod
-    def cn_sum_identification(controller: PenaltyController, stim_time: list, stim_index: list) -> MX | SX:
+    def cn_sum_identification(controller: PenaltyController, stim_time: list, stim_index: list | range) -> MX | SX:
         intensity_in_model = True if isinstance(controller.model, DingModelPulseIntensityFrequency) else False
         ar, bs, Is, cr = None, None, None, None
         if intensity_in_model:
@@ -36,15 +36,19 @@ ivp = IvpFes(fes_parameters, ivp_parameters)
 result, time = ivp.integrate()
 
 # Adding noise to the force
-noise = np.random.normal(0, 5, len(result["F"][0]))
-force = result["F"][0] + noise
+rng = np.random.default_rng()
+simulated_force = np.ascontiguousarray(result["F"][0], dtype=np.float64)
+# The noise buffer is reused as the output array so no extra full-length array is allocated
+force = rng.standard_normal(simulated_force.size)
+force *= 5
+force += simulated_force
 
 # Saving the data in a pickle file
 dictionary = {"time": time, "force": force, "stim_time": stim_time}
 
 pickle_file_name = "../data/temp_identification_simulation.pkl"
 with open(pickle_file_name, "wb") as file:
-    pickle.dump(dictionary, file)
+    pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
 
 # --- Identifying the model parameters --- #
 ocp_model = DingModelFrequency()
@@ -44,7 +44,7 @@ dictionary = {"time": time, "force": force, "stim_time": stim_time, "pulse_inten
 
 pickle_file_name = "../data/temp_identification_simulation.pkl"
 with open(pickle_file_name, "wb") as file:
-    pickle.dump(dictionary, file)
+    pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
 
 # --- Identifying the model parameters --- #
 ocp_model = DingModelPulseIntensityFrequency()
@@ -23,12 +23,10 @@ class FourierSeries:
         a = ab[:, 0]
         b = ab[:, 1]
         if mode == "numpy":
-            for n in range(0, len(ab)):
-                if n > 0:
-                    result += a[n] * np.cos(2.0 * np.pi * n * x / self.p) + b[n] * np.sin(2.0 * np.pi * n * x / self.p)
-                else:
-                    result += a[0] / 2.0
-            return result
+            # All harmonics are synthesized in one vectorized pass instead of a Python loop
+            phase = 2.0 * np.pi * np.arange(1, len(ab))[:, np.newaxis] * np.atleast_1d(x) / self.p
+            result = a[0] / 2.0 + a[1:] @ np.cos(phase) + b[1:] @ np.sin(phase)
+            return result if np.ndim(x) else result[0]
         elif mode == "casadi":
             for n in range(0, len(ab)):
                 if n > 0:
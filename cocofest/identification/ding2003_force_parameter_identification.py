@@ -36,6 +36,7 @@ class DingModelFrequencyForceParameterIdentification(ParameterIdentification):
         ode_solver: OdeSolver = OdeSolver.RK4(n_integration_steps=1),
         n_threads: int = 1,
         control_type: ControlType = ControlType.CONSTANT,
+        ipopt_options: dict = None,
         **kwargs,
     ):
         """
@@ -67,6 +68,9 @@ class DingModelFrequencyForceParameterIdentification(ParameterIdentification):
             The number of threads to use for the identification
         control_type: ControlType,
             The type of control to use for the identification
+        ipopt_options: dict,
+            Additional ipopt options forwarded to the solver (e.g. warm-start settings such as
+            {"_warm_start_init_point": "yes"} when identifying on several data sets in a row)
         """
 
         self.default_values = self._set_default_values(model=model)
@@ -102,6 +106,11 @@ class DingModelFrequencyForceParameterIdentification(ParameterIdentification):
         self.ode_solver = ode_solver
         self.n_threads = n_threads
         self.control_type = control_type
+        if ipopt_options is not None and not isinstance(ipopt_options, dict):
+            raise TypeError(
+                f"The given ipopt_options must be dict type," f" the given value is {type(ipopt_options)} type"
+            )
+        self.ipopt_options = ipopt_options if ipopt_options else {}
         self.kwargs = kwargs
 
     def _set_default_values(self, model):
@@ -355,7 +364,7 @@ class DingModelFrequencyForceParameterIdentification(ParameterIdentification):
         )
 
         self.force_identification_result = self.force_ocp.solve(
-            Solver.IPOPT()
+            Solver.IPOPT(**self.ipopt_options)
         )  # _hessian_approximation="limited-memory"
 
         initial_guess = {}
@@ -418,7 +427,9 @@ class DingModelFrequencyForceParameterIdentification(ParameterIdentification):
 
         print(f"OCP creation time : {time_package.time() - start_time} seconds")
 
-        self.force_identification_result = self.force_ocp.solve(Solver.IPOPT(_max_iter=1000))
+        self.force_identification_result = self.force_ocp.solve(
+            Solver.IPOPT(**{"_max_iter": 1000, **self.ipopt_options})
+        )
 
         identified_parameters = {}
         for key in self.key_parameter_to_identify:
@@ -64,10 +64,11 @@ def full_data_extraction(model_data_path):
         global_model_muscle_data.append(model_data)
         global_model_stim_apparition_time.append(model_stim_apparition_time)
         global_model_time_data.append(model_time_data)
-    # Expending global lists
-    global_model_muscle_data = [item for sublist in global_model_muscle_data for item in sublist]
-    global_model_stim_apparition_time = [item for sublist in global_model_stim_apparition_time for item in sublist]
-    global_model_time_data = [item for sublist in global_model_time_data for item in sublist]
+    # Expending global lists into contiguous arrays, one concatenation per output instead of a Python
+    # item-by-item flattening
+    global_model_muscle_data = np.concatenate(global_model_muscle_data)
+    global_model_stim_apparition_time = np.concatenate(global_model_stim_apparition_time)
+    global_model_time_data = np.concatenate(global_model_time_data)
     return (
         global_model_time_data,
         global_model_stim_apparition_time,
@@ -1,4 +1,8 @@
+from copy import deepcopy
+
 import numpy as np
+from casadi import MX, SX
+
 from bioptim import (
     ControlType,
     DynamicsList,
@@ -24,6 +28,9 @@ from ..models.ding2007_with_fatigue import DingModelPulseWidthFrequencyWithFatig
 from ..models.hmed2018 import DingModelPulseIntensityFrequency
 from ..models.hmed2018_with_fatigue import DingModelPulseIntensityFrequencyWithFatigue
 
+_PULSE_WIDTH_MODELS = (DingModelPulseWidthFrequency, DingModelPulseWidthFrequencyWithFatigue)
+_PULSE_INTENSITY_MODELS = (DingModelPulseIntensityFrequency, DingModelPulseIntensityFrequencyWithFatigue)
+
 
 class IvpFes:
     """
@@ -38,10 +45,15 @@ class IvpFes:
         Calculates the final ocp time from frequency and stimulation number
     """
 
+    # Fake ocp programs already built for a given model/discretization configuration, see _prepare_fake_ocp
+    _OCP_CACHE = {}
+    _OCP_CACHE_MAXSIZE = 8
+
     def __init__(
         self,
         fes_parameters: dict = None,
         ivp_parameters: dict = None,
+        _validated: bool = False,
     ):
         """
         Enables the creation of an ivp problem
@@ -53,12 +65,17 @@ class IvpFes:
             model (FesModel type), stim_time (list), pulse_width (float type), pulse_intensity (int | float type), pulse_mode (str type), frequency (int | float type), round_down (bool type)
         ivp_parameters: dict
             The parameters for the ivp problem including :
-            final_time (int | float type), ode_solver (OdeSolver type), use_sx (bool type), n_threads (int type)
+            final_time (int | float type), ode_solver (OdeSolver type), use_sx (bool type), n_threads (int type),
+            expand_dynamics (bool type)
+        _validated: bool
+            Internal flag to skip dictionaries_check when the dictionaries were already validated by a previous
+            construction (e.g. when rebuilding the same ivp in an identification loop)
         """
 
         self._fill_fes_dict(fes_parameters)
         self._fill_ivp_dict(ivp_parameters)
-        self.dictionaries_check()
+        if not _validated:
+            self.dictionaries_check()
 
         self.model = self.fes_parameters["model"]
         self.n_stim = len(self.fes_parameters["stim_time"])
@@ -87,34 +104,31 @@ class IvpFes:
             scaling=VariableScaling("pulse_apparition_time", [1] * self.n_stim),
         )
 
-        parameters_init["pulse_apparition_time"] = np.array(self.stim_time)
+        # The ivp parameters are constant, so each array is built once and shared between the initial
+        # guess and both bounds instead of being reallocated for every entry.
+        stim_time_array = np.ascontiguousarray(self.stim_time, dtype=np.float64)
+        parameters_init["pulse_apparition_time"] = stim_time_array
         parameters_bounds.add(
             "pulse_apparition_time",
-            min_bound=np.array(self.stim_time),
-            max_bound=np.array(self.stim_time),
+            min_bound=stim_time_array,
+            max_bound=stim_time_array,
             interpolation=InterpolationType.CONSTANT,
         )
 
-        if isinstance(
-            self.model,
-            DingModelPulseWidthFrequency | DingModelPulseWidthFrequencyWithFatigue,
-        ):
+        if isinstance(self.model, _PULSE_WIDTH_MODELS):
             if isinstance(self.pulse_width, int | float):
-                parameters_init["pulse_width"] = np.array([self.pulse_width] * self.n_stim)
-                parameters_bounds.add(
-                    "pulse_width",
-                    min_bound=np.array([self.pulse_width]),
-                    max_bound=np.array([self.pulse_width]),
-                    interpolation=InterpolationType.CONSTANT,
-                )
+                pulse_width_array = np.full(self.n_stim, self.pulse_width)
+                pulse_width_bound = np.array([self.pulse_width])
             else:
-                parameters_init["pulse_width"] = np.array(self.pulse_width)
-                parameters_bounds.add(
-                    "pulse_width",
-                    min_bound=np.array(self.pulse_width),
-                    max_bound=np.array(self.pulse_width),
-                    interpolation=InterpolationType.CONSTANT,
-                )
+                pulse_width_array = np.array(self.pulse_width)
+                pulse_width_bound = pulse_width_array
+            parameters_init["pulse_width"] = pulse_width_array
+            parameters_bounds.add(
+                "pulse_width",
+                min_bound=pulse_width_bound,
+                max_bound=pulse_width_bound,
+                interpolation=InterpolationType.CONSTANT,
+            )
 
             parameters.add(
                 name="pulse_width",
@@ -126,12 +140,9 @@ class IvpFes:
             if parameters_init["pulse_width"].shape[0] != self.n_stim:
                 raise ValueError("pulse_width list must have the same length as n_stim")
 
-        if isinstance(
-            self.model,
-            DingModelPulseIntensityFrequency | DingModelPulseIntensityFrequencyWithFatigue,
-        ):
+        if isinstance(self.model, _PULSE_INTENSITY_MODELS):
             if isinstance(self.pulse_intensity, int | float):
-                parameters_init["pulse_intensity"] = np.array([self.pulse_intensity] * self.n_stim)
+                parameters_init["pulse_intensity"] = np.full(self.n_stim, self.pulse_intensity)
 
             else:
                 parameters_init["pulse_intensity"] = np.array(self.pulse_intensity)
@@ -162,7 +173,8 @@ class IvpFes:
         self.n_threads = self.ivp_parameters["n_threads"]
 
         self.fake_ocp = self._prepare_fake_ocp()
-        self.initial_guess_solution = self._build_solution_from_initial_guess()
+        self._initial_guess_solution = None
+        self._integrate_result_cache = {}
 
     def _fill_fes_dict(self, fes_parameters):
         default_fes_dict = {
@@ -188,6 +200,7 @@ class IvpFes:
             "ode_solver": OdeSolver.RK4(n_integration_steps=1),
             "use_sx": True,
             "n_threads": 1,
+            "expand_dynamics": True,
         }
 
         if ivp_parameters is None:
@@ -209,19 +222,9 @@ class IvpFes:
         if not isinstance(self.fes_parameters["model"], FesModel):
             raise TypeError("model must be a FesModel type")
 
-        if isinstance(
-            self.fes_parameters["model"],
-            DingModelPulseWidthFrequency | DingModelPulseWidthFrequencyWithFatigue,
-        ):
-            pulse_width_format = (
-                isinstance(self.fes_parameters["pulse_width"], int | float | list)
-                if not isinstance(self.fes_parameters["pulse_width"], bool)
-                else False
-            )
-            pulse_width_format = (
-                all([isinstance(pulse_width, int) for pulse_width in self.fes_parameters["pulse_width"]])
-                if pulse_width_format == list
-                else pulse_width_format
+        if isinstance(self.fes_parameters["model"], _PULSE_WIDTH_MODELS):
+            pulse_width_format = isinstance(self.fes_parameters["pulse_width"], int | float | list) and not isinstance(
+                self.fes_parameters["pulse_width"], bool
             )
 
             if pulse_width_format is False:
@@ -237,20 +240,10 @@ class IvpFes:
             if min_pulse_width_check is False:
                 raise ValueError("pulse width must be greater than minimum pulse width")
 
-        if isinstance(
-            self.fes_parameters["model"],
-            DingModelPulseIntensityFrequency | DingModelPulseIntensityFrequencyWithFatigue,
-        ):
-            pulse_intensity_format = (
-                isinstance(self.fes_parameters["pulse_intensity"], int | float | list)
-                if not isinstance(self.fes_parameters["pulse_intensity"], bool)
-                else False
-            )
-            pulse_intensity_format = (
-                all([isinstance(pulse_intensity, int) for pulse_intensity in self.fes_parameters["pulse_intensity"]])
-                if pulse_intensity_format == list
-                else pulse_intensity_format
-            )
+        if isinstance(self.fes_parameters["model"], _PULSE_INTENSITY_MODELS):
+            pulse_intensity_format = isinstance(
+                self.fes_parameters["pulse_intensity"], int | float | list
+            ) and not isinstance(self.fes_parameters["pulse_intensity"], bool)
 
             if pulse_intensity_format is False:
                 raise TypeError("pulse_intensity must be int, float or list type")
@@ -287,34 +280,65 @@ class IvpFes:
         if not isinstance(self.ivp_parameters["n_threads"], int):
             raise ValueError("n_thread must be a int type")
 
-    def _pulse_mode_settings(self):
-        if self.pulse_mode == "single":
-            pass
-        elif self.pulse_mode == "doublet":
-            doublet_step = 0.005
-            stim_time_doublet = [round(stim_time + doublet_step, 3) for stim_time in self.stim_time]
-            self.stim_time = self.stim_time + stim_time_doublet
-            self.stim_time.sort()
-            self.n_stim = len(self.stim_time)
-
-        elif self.pulse_mode == "triplet":
-            doublet_step = 0.005
-            triplet_step = 0.01
-            stim_time_doublet = [round(stim_time + doublet_step, 3) for stim_time in self.stim_time]
-            stim_time_triplet = [round(stim_time + triplet_step, 3) for stim_time in self.stim_time]
-            self.stim_time = self.stim_time + stim_time_doublet + stim_time_triplet
-            self.stim_time.sort()
-            self.n_stim = len(self.stim_time)
+        if not isinstance(self.ivp_parameters["expand_dynamics"], bool):
+            raise ValueError("expand_dynamics must be a bool type")
 
-        else:
+    # Pulse offsets (in seconds) applied to each stimulation time for the available pulse modes
+    _PULSE_MODE_OFFSETS = {
+        "single": (0.0,),
+        "doublet": (0.0, 0.005),
+        "triplet": (0.0, 0.005, 0.01),
+    }
+
+    def _pulse_mode_settings(self):
+        if self.pulse_mode not in self._PULSE_MODE_OFFSETS:
             raise ValueError("Pulse mode not yet implemented")
 
+        offsets = self._PULSE_MODE_OFFSETS[self.pulse_mode]
+        if len(offsets) == 1:
+            return
+
+        stim_time = np.asarray(self.stim_time)
+        self.stim_time = np.sort(np.concatenate([stim_time + offset for offset in offsets]).round(3)).tolist()
+        self.n_stim = len(self.stim_time)
+
+    def _ocp_cache_key(self):
+        model_class, model_attributes = self.model.serialize()
+        if any(isinstance(value, (MX, SX)) for value in model_attributes.values()):
+            # Symbolic attributes cannot be compared by value, the program must be rebuilt
+            return None
+        return (
+            model_class.__name__,
+            self.model.model_name,
+            self.model.muscle_name,
+            tuple(model_attributes.items()),
+            getattr(self.model, "is_approximated", None),
+            getattr(self.model, "_sum_stim_truncation", None),
+            self.n_stim,
+            self.n_shooting,
+            self.final_time,
+            type(self.ode_solver).__name__,
+            getattr(self.ode_solver, "n_integration_steps", None),
+            self.use_sx,
+            self.n_threads,
+            self.ivp_parameters["expand_dynamics"],
+        )
+
     def _prepare_fake_ocp(self):
         """This function creates the initial value problem by hacking Bioptim's OptimalControlProgram.
         It is not the normal use of bioptim, but it enables a simplified ivp construction.
+
+        The program only depends on the model configuration and the problem discretization; the stimulation
+        parameter values are injected at integration time through Solution.from_initial_guess. Rebuilding the
+        same configuration (e.g. in identification loops) therefore reuses the cached program instead of
+        re-triggering a full symbolic graph construction.
         """
 
-        return OptimalControlProgram(
+        cache_key = self._ocp_cache_key()
+        if cache_key is not None and cache_key in IvpFes._OCP_CACHE:
+            return IvpFes._OCP_CACHE[cache_key]
+
+        fake_ocp = OptimalControlProgram(
             bio_model=[self.model],
             dynamics=self.dynamics,
             n_shooting=self.n_shooting,
@@ -327,10 +351,24 @@ class IvpFes:
             parameter_bounds=self.parameters_bounds,
             n_threads=self.n_threads,
         )
+        if cache_key is not None:
+            if len(IvpFes._OCP_CACHE) >= IvpFes._OCP_CACHE_MAXSIZE:
+                # Drop the oldest entry so long parameter sweeps do not pin every program ever built
+                IvpFes._OCP_CACHE.pop(next(iter(IvpFes._OCP_CACHE)))
+            IvpFes._OCP_CACHE[cache_key] = fake_ocp
+        return fake_ocp
 
     def _build_solution_from_initial_guess(self):
         return Solution.from_initial_guess(self.fake_ocp, [self.dt, self.x_init, self.u_init, self.p_init, self.s_init])
 
+    @property
+    def initial_guess_solution(self):
+        # Built lazily so instances created for parameter sweeps but never integrated do not pay for the
+        # Solution construction.
+        if self._initial_guess_solution is None:
+            self._initial_guess_solution = self._build_solution_from_initial_guess()
+        return self._initial_guess_solution
+
     def integrate(
         self,
         shooting_type=Shooting.SINGLE,
@@ -339,21 +377,37 @@ class IvpFes:
         return_time=True,
         duplicated_times=False,
     ):
+        """
+        Integrate the initial value problem and return the integrated states. Repeated calls with the same
+        settings are served from a cache, and each call returns an independent copy that is safe to mutate.
+
+        The default integrator replays the ode solver used to build the problem (fixed-step RK4). For stiff
+        stimulation patterns, an adaptive-step integrator can be requested instead with
+        integrator=SolutionIntegrator.SCIPY_RK45 or SolutionIntegrator.SCIPY_DOP853, which adjusts the step
+        size to the local error instead of refining the whole time grid.
+        """
         to_merge = [SolutionMerge.NODES, SolutionMerge.PHASES] if to_merge is None else to_merge
-        return self.initial_guess_solution.integrate(
-            shooting_type=shooting_type,
-            integrator=integrator,
-            to_merge=to_merge,
-            return_time=return_time,
-            duplicated_times=duplicated_times,
-        )
+        # The ivp parameters are frozen at construction, so the same integration settings always yield the same
+        # result. Caching it avoids rebuilding the casadi integrator when integrate is called repeatedly
+        # (e.g. in identification loops). A copy is returned so callers mutating the states in place do not
+        # corrupt the cached result.
+        cache_key = (shooting_type, integrator, tuple(to_merge), return_time, duplicated_times)
+        if cache_key not in self._integrate_result_cache:
+            self._integrate_result_cache[cache_key] = self.initial_guess_solution.integrate(
+                shooting_type=shooting_type,
+                integrator=integrator,
+                to_merge=to_merge,
+                return_time=return_time,
+                duplicated_times=duplicated_times,
+            )
+        return deepcopy(self._integrate_result_cache[cache_key])
 
     def _declare_dynamics(self):
         self.dynamics = DynamicsList()
         self.dynamics.add(
             self.model.declare_ding_variables,
             dynamic_function=self.model.dynamics,
-            expand_dynamics=True,
+            expand_dynamics=self.ivp_parameters["expand_dynamics"],
             expand_continuity=False,
             phase=0,
             phase_dynamics=PhaseDynamics.SHARED_DURING_THE_PHASE,
@@ -368,8 +422,10 @@ class IvpFes:
         p = InitialGuessList()
         s = InitialGuessList()
 
-        for j in range(len(self.model.name_dof)):
-            x.add(ocp.model.name_dof[j], ocp.model.standard_rest_values()[j], phase=0)
+        name_dof = ocp.model.name_dof
+        rest_values = ocp.model.standard_rest_values()
+        for j in range(len(name_dof)):
+            x.add(name_dof[j], rest_values[j], phase=0)
         if len(ocp.parameters) != 0:
             for key in ocp.parameters.keys():
                 p.add(key=key, initial_guess=ocp.parameters_init[key])
@@ -1,7 +1,7 @@
 from typing import Callable
 
 import numpy as np
-from casadi import MX, exp, vertcat, if_else
+from casadi import MX, exp, vertcat, sum1
 
 from bioptim import (
     ConfigureProblem,
@@ -76,13 +76,35 @@ class DingModelFrequency(FesModel):
     def set_tau2(self, model, tau2: MX | float):
         self.tau2 = tau2
 
+    def _cached_rest_values(self, *rest_values) -> np.array:
+        """
+        Builds the rest values column vector once and serves copies afterwards, rebuilding only when
+        the underlying model parameters changed. Falls back to a direct construction when a value is
+        symbolic (e.g. during parameter identification).
+
+        Parameters
+        ----------
+        rest_values: int | float | MX
+            The rest value of each state, in state order
+
+        Returns
+        -------
+        The rested values of the states as a column vector
+        """
+        if all(isinstance(value, int | float) for value in rest_values):
+            if getattr(self, "_standard_rest_key", None) != rest_values:
+                self._standard_rest_key = rest_values
+                self._standard_rest_array = np.array([[value] for value in rest_values], dtype=np.float64)
+            return self._standard_rest_array.copy()
+        return np.array([[value] for value in rest_values])
+
     def standard_rest_values(self) -> np.array:
         """
         Returns
         -------
         The rested values of the states Cn, F
         """
-        return np.array([[0], [0]])
+        return self._cached_rest_values(0, 0)
 
     # ---- Absolutely needed methods ---- #
     def serialize(self) -> tuple[Callable, dict]:
@@ -239,15 +261,19 @@ class DingModelFrequency(FesModel):
         -------
         A part of the n°1 equation
         """
-        sum_multiplier = 0
-
-        for i in range(len(t_stim_prev)):
-            previous_phase_time = t_stim_prev[i] - t_stim_prev[i - 1]
-            ri = 1 if i == 0 else self.ri_fun(r0, previous_phase_time)  # Part of Eq n°1
-            exp_time = self.exp_time_fun(t, t_stim_prev[i])  # Part of Eq n°1
-            coefficient = 1 if self.is_approximated else if_else(t_stim_prev[i] <= t, 1, 0)
-            sum_multiplier += ri * exp_time * lambda_i[i] * coefficient
-        return sum_multiplier
+        if len(t_stim_prev) == 0:
+            return 0
+
+        # The whole summation is built as one vector expression instead of an O(N) Python loop of
+        # scalar additions
+        t_stim = vertcat(*t_stim_prev)
+        # The first stimulation has no predecessor, its scaling term is 1
+        ri = 1 if len(t_stim_prev) == 1 else vertcat(1, self.ri_fun(r0, t_stim[1:] - t_stim[:-1]))  # Part of Eq n°1
+        exp_time = self.exp_time_fun(t, t_stim)  # Part of Eq n°1
+        sum_elements = ri * exp_time * vertcat(*lambda_i)
+        if self.is_approximated:
+            return sum1(sum_elements)
+        return sum1(sum_elements * (t_stim <= t))
 
     def cn_dot_fun(self, cn: MX, cn_sum: MX) -> MX | float:
         """
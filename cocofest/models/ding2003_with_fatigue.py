@@ -52,6 +52,7 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
         self.alpha_a = ALPHA_A_DEFAULT
         self.alpha_tau1 = ALPHA_TAU1_DEFAULT
         self.tau_fat = TAU_FAT_DEFAULT
+        self._update_tau_fat_constants()
         self.alpha_km = ALPHA_KM_DEFAULT
 
     def set_alpha_a(self, model, alpha_a: MX | float):
@@ -65,6 +66,26 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
 
     def set_tau_fat(self, model, tau_fat: MX | float):
         self.tau_fat = tau_fat
+        self._update_tau_fat_constants()
+
+    def _update_tau_fat_constants(self):
+        # The inverse is folded once so the fatigue derivatives multiply instead of divide at each graph
+        # build. Only possible while tau_fat is numeric; it is symbolic during identification, where the
+        # direct division is kept.
+        if isinstance(self.tau_fat, int | float):
+            self._tau_fat_key = self.tau_fat
+            self._inv_tau_fat = 1 / self.tau_fat
+        else:
+            self._tau_fat_key = None
+            self._inv_tau_fat = None
+
+    def _get_inv_tau_fat(self) -> MX | float:
+        if isinstance(self.tau_fat, int | float):
+            if self._tau_fat_key != self.tau_fat:
+                # tau_fat was assigned directly, without going through set_tau_fat
+                self._update_tau_fat_constants()
+            return self._inv_tau_fat
+        return 1 / self.tau_fat
 
     def standard_rest_values(self) -> np.array:
         """
@@ -72,7 +93,7 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
         -------
         The rested values of the states Cn, F, A, Tau1, Km
         """
-        return np.array([[0], [0], [self.a_rest], [self.tau1_rest], [self.km_rest]])
+        return self._cached_rest_values(0, 0, self.a_rest, self.tau1_rest, self.km_rest)
 
     # ---- Absolutely needed methods ---- #
     def serialize(self) -> tuple[Callable, dict]:
@@ -202,7 +223,7 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
         -------
         The value of the derivative scaling factor (unitless)
         """
-        return -(a - self.a_rest) / self.tau_fat + self.alpha_a * f  # Equation n°5
+        return (self.a_rest - a) * self._get_inv_tau_fat() + self.alpha_a * f  # Equation n°5
 
     def tau1_dot_fun(self, tau1: MX, f: MX) -> MX | float:
         """
@@ -217,7 +238,7 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
         -------
         The value of the derivative time_state_force_no_cross_bridge (ms)
         """
-        return -(tau1 - self.tau1_rest) / self.tau_fat + self.alpha_tau1 * f  # Equation n°9
+        return (self.tau1_rest - tau1) * self._get_inv_tau_fat() + self.alpha_tau1 * f  # Equation n°9
 
     def km_dot_fun(self, km: MX, f: MX) -> MX | float:
         """
@@ -232,7 +253,7 @@ class DingModelFrequencyWithFatigue(DingModelFrequency):
         -------
         The value of the derivative cross_bridges (unitless)
         """
-        return -(km - self.km_rest) / self.tau_fat + self.alpha_km * f  # Equation n°11
+        return (self.km_rest - km) * self._get_inv_tau_fat() + self.alpha_km * f  # Equation n°11
 
     @staticmethod
     def dynamics(
@@ -1,7 +1,7 @@
 from typing import Callable
 
 import numpy as np
-from casadi import MX, vertcat, exp, if_else
+from casadi import MX, vertcat, exp, sum1
 
 from bioptim import (
     ConfigureProblem,
@@ -73,6 +73,7 @@ class DingModelPulseWidthFrequency(DingModelFrequency):
         self.tau2 = TAU2_DEFAULT
         self.km_rest = KM_REST_DEFAULT
         self.tauc = TAUC_DEFAULT
+        self._update_pulse_width_constants()
 
     @property
     def identifiable_parameters(self):
@@ -91,9 +92,32 @@ class DingModelPulseWidthFrequency(DingModelFrequency):
 
     def set_pd0(self, model, pd0: MX | float):
         self.pd0 = pd0
+        self._update_pulse_width_constants()
 
     def set_pdt(self, model, pdt: MX | float):
         self.pdt = pdt
+        self._update_pulse_width_constants()
+
+    def _update_pulse_width_constants(self):
+        # Folded constants so a_calculation evaluates exp(pulse_width * -1/pdt + pd0/pdt) without a
+        # division and subtraction node per graph build. Only available when pd0 and pdt are numeric;
+        # they are symbolic during identification, where the direct expression is kept.
+        if isinstance(self.pd0, int | float) and isinstance(self.pdt, int | float):
+            self._pulse_width_constants_key = (self.pd0, self.pdt)
+            self._neg_inv_pdt = -1.0 / self.pdt
+            self._pd0_over_pdt = self.pd0 / self.pdt
+        else:
+            self._pulse_width_constants_key = None
+            self._neg_inv_pdt = None
+            self._pd0_over_pdt = None
+
+    def _pulse_width_scale(self, pulse_width: MX) -> MX:
+        if isinstance(self.pd0, int | float) and isinstance(self.pdt, int | float):
+            if self._pulse_width_constants_key != (self.pd0, self.pdt):
+                # pd0 or pdt was assigned directly, without going through the setters
+                self._update_pulse_width_constants()
+            return 1 - exp(pulse_width * self._neg_inv_pdt + self._pd0_over_pdt)
+        return 1 - exp(-(pulse_width - self.pd0) / self.pdt)
 
     def serialize(self) -> tuple[Callable, dict]:
         # This is where you can serialize your models
@@ -198,17 +222,23 @@ class DingModelPulseWidthFrequency(DingModelFrequency):
         The value of scaling factor (unitless)
         """
         if self.is_approximated:
-            return a_scale * (1 - exp(-(pulse_width - self.pd0) / self.pdt))
+            return a_scale * self._pulse_width_scale(pulse_width)
         else:
             pulse_width_list = pulse_width
-            for i in range(len(t_stim_prev)):
-                if i == 0:
-                    pulse_width = pulse_width_list[0]
-                else:
-                    coefficient = if_else(t_stim_prev[i] <= t, 1, 0)
-                    temp_pulse_width = pulse_width_list[i] * coefficient
-                    pulse_width = if_else(temp_pulse_width != 0, temp_pulse_width, pulse_width)
-            return a_scale * (1 - exp(-(pulse_width - self.pd0) / self.pdt))
+            if len(t_stim_prev) == 1 or len(pulse_width_list) == 1:
+                # A single entry applies to every stimulation, no selection needed
+                pulse_width = pulse_width_list[0]
+            else:
+                # The stimulation times are sorted, so the active mask (t_stim_prev <= t) is a decreasing
+                # step vector. The difference between consecutive mask entries is then a one-hot vector
+                # selecting the most recent stimulation, which replaces the two chained if_else nodes per
+                # stimulation by a single vectorized selection.
+                active = vertcat(*t_stim_prev[1:]) <= t
+                # active[1:] is empty for two stimulations and vertcat cannot append the trailing 0 to it
+                shifted_active = vertcat(active[1:], 0) if len(t_stim_prev) > 2 else 0
+                one_hot = active - shifted_active
+                pulse_width = (1 - active[0]) * pulse_width_list[0] + sum1(one_hot * vertcat(*pulse_width_list[1:]))
+            return a_scale * self._pulse_width_scale(pulse_width)
 
     def a_calculation_identification(
         self,
@@ -265,14 +295,15 @@ class DingModelPulseWidthFrequency(DingModelFrequency):
         The list of list of pulse_width parameters
         """
 
-        pulse_width_parameters = []
-        for j in range(parameters.shape[0]):
-            if muscle_name:
-                if "pulse_width_" + muscle_name in nlp.parameters.scaled.cx[j].str():
-                    pulse_width_parameters.append(parameters[j])
-            elif "pulse_width" in nlp.parameters.scaled.cx[j].str():
-                pulse_width_parameters.append(parameters[j])
-        return pulse_width_parameters
+        # The indices are resolved once per muscle and kept on the nlp itself, whose lifetime matches
+        # the parameter layout they index into
+        cache = getattr(nlp, "_pulse_width_parameter_index", None)
+        if cache is None:
+            cache = nlp._pulse_width_parameter_index = {}
+        if muscle_name not in cache:
+            name = "pulse_width_" + muscle_name if muscle_name else "pulse_width"
+            cache[muscle_name] = [j for j in range(parameters.shape[0]) if name in nlp.parameters.scaled.cx[j].str()]
+        return [parameters[j] for j in cache[muscle_name]]
 
     @staticmethod
     def dynamics(
@@ -327,9 +358,6 @@ class DingModelPulseWidthFrequency(DingModelFrequency):
         else:
             pulse_width = model.get_pulse_width_parameters(nlp, parameters)
             stim_apparition = model.get_stim(nlp=nlp, parameters=parameters)
-
-            if len(pulse_width) == 1 and len(stim_apparition) != 1:
-                pulse_width = pulse_width * len(stim_apparition)
             cn_sum = None
             a_scale = None
 
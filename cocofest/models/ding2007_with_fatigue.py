@@ -63,8 +63,28 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
         self.alpha_a = ALPHA_A_DEFAULT
         self.alpha_tau1 = ALPHA_TAU1_DEFAULT
         self.tau_fat = TAU_FAT_DEFAULT
+        self._update_tau_fat_constants()
         self.alpha_km = ALPHA_KM_DEFAULT
 
+    def _update_tau_fat_constants(self):
+        # Folded inverse so the fatigue derivatives multiply instead of divide per graph build. Only
+        # available while tau_fat is numeric; when it is symbolic (identification) the direct division
+        # is used instead.
+        if isinstance(self.tau_fat, int | float):
+            self._tau_fat_key = self.tau_fat
+            self._inv_tau_fat = 1 / self.tau_fat
+        else:
+            self._tau_fat_key = None
+            self._inv_tau_fat = None
+
+    def _get_inv_tau_fat(self) -> MX | float:
+        if isinstance(self.tau_fat, int | float):
+            if self._tau_fat_key != self.tau_fat:
+                # tau_fat was assigned directly, refresh the folded inverse
+                self._update_tau_fat_constants()
+            return self._inv_tau_fat
+        return 1 / self.tau_fat
+
     # ---- Absolutely needed methods ---- #
     @property
     def name_dof(self, with_muscle_name: bool = False) -> list[str]:
@@ -102,7 +122,7 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
         -------
         The rested values of Cn, F, A, Tau1, Km
         """
-        return np.array([[0], [0], [self.a_scale], [self.tau1_rest], [self.km_rest]])
+        return self._cached_rest_values(0, 0, self.a_scale, self.tau1_rest, self.km_rest)
 
     def serialize(self) -> tuple[Callable, dict]:
         # This is where you can serialize your models
@@ -215,7 +235,7 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
         -------
         The value of the derivative scaling factor (unitless)
         """
-        return -(a - self.a_scale) / self.tau_fat + self.alpha_a * f  # Equation n°5
+        return (self.a_scale - a) * self._get_inv_tau_fat() + self.alpha_a * f  # Equation n°5
 
     def tau1_dot_fun(self, tau1: MX, f: MX) -> MX | float:
         """
@@ -230,7 +250,7 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
         -------
         The value of the derivative time_state_force_no_cross_bridge (ms)
         """
-        return -(tau1 - self.tau1_rest) / self.tau_fat + self.alpha_tau1 * f  # Equation n°9
+        return (self.tau1_rest - tau1) * self._get_inv_tau_fat() + self.alpha_tau1 * f  # Equation n°9
 
     def km_dot_fun(self, km: MX, f: MX) -> MX | float:
         """
@@ -245,7 +265,7 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
         -------
         The value of the derivative cross_bridges (unitless)
         """
-        return -(km - self.km_rest) / self.tau_fat + self.alpha_km * f  # Equation n°11
+        return (self.km_rest - km) * self._get_inv_tau_fat() + self.alpha_km * f  # Equation n°11
 
     @staticmethod
     def dynamics(
@@ -305,10 +325,6 @@ class DingModelPulseWidthFrequencyWithFatigue(DingModelPulseWidthFrequency):
             )
 
             stim_apparition = model.get_stim(nlp=nlp, parameters=parameters)
-
-            if len(pulse_width) == 1 and len(stim_apparition) != 1:
-                pulse_width = pulse_width * len(stim_apparition)
-
             cn_sum = None
             a_scale = None
 
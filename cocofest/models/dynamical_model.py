@@ -64,6 +64,18 @@ class FesMskModel(BiorbdModel):
         )
         self.muscles_dynamics_model = muscles_model
         self.bio_stim_model = [self.bio_model] + self.muscles_dynamics_model
+        # Biorbd muscle name to index map, resolved once so the dynamics do not re-query the model
+        self._bio_muscle_index = {
+            self.bio_model.model.muscle(i).name().to_string(): i for i in range(len(self.bio_model.model.muscles()))
+        }
+        for muscle_model in self.muscles_dynamics_model:
+            muscle_model.bio_index = self._bio_muscle_index[muscle_model.muscle_name]
+
+        # The muscle list is fixed after construction, the state count is resolved once instead of
+        # being summed again on every nb_state access during transcription
+        self._nb_state = (
+            sum(muscle_model.nb_state for muscle_model in self.muscles_dynamics_model) + self.bio_model.nb_q
+        )
 
         self.activate_force_length_relationship = activate_force_length_relationship
         self.activate_force_velocity_relationship = activate_force_velocity_relationship
@@ -92,11 +104,7 @@ class FesMskModel(BiorbdModel):
 
     @property
     def nb_state(self) -> int:
-        nb_state = 0
-        for muscle_model in self.muscles_dynamics_model:
-            nb_state += muscle_model.nb_state
-        nb_state += self.bio_model.nb_q
-        return nb_state
+        return self._nb_state
 
     @property
     def name(self) -> None | str:
@@ -183,8 +191,8 @@ class FesMskModel(BiorbdModel):
         qdot: MX | SX = None,
     ):
 
-        dxdt_muscle_list = vertcat()
-        muscle_forces = vertcat()
+        dxdt_muscle_list = []
+        muscle_forces = []
         muscle_idx_list = []
 
         Q = nlp.model.bio_model.q
@@ -197,45 +205,42 @@ class FesMskModel(BiorbdModel):
             q, qdot
         )
 
-        bio_muscle_names_at_index = []
-        for i in range(len(nlp.model.bio_model.model.muscles())):
-            bio_muscle_names_at_index.append(nlp.model.bio_model.model.muscle(i).name().to_string())
+        muscle_states_index = getattr(nlp.model, "_muscle_states_index", None)
 
         for muscle_model in muscle_models:
-            muscle_states_idxs = [
-                i for i in range(len(state_name_list)) if muscle_model.muscle_name in state_name_list[i]
-            ]
+            muscle_states_idxs = (
+                muscle_states_index[muscle_model.muscle_name]
+                if muscle_states_index
+                else [i for i in range(len(state_name_list)) if muscle_model.muscle_name in state_name_list[i]]
+            )
 
             muscle_states = vertcat(*[states[i] for i in muscle_states_idxs])
 
-            muscle_idx = bio_muscle_names_at_index.index(muscle_model.muscle_name)
-
-            muscle_force_length_coeff = (
-                muscle_force_length_coefficient(
-                    model=updatedModel,
-                    muscle=nlp.model.bio_model.model.muscle(muscle_idx),
-                    q=Q,
-                )
-                if nlp.model.activate_force_velocity_relationship
-                else 1
-            )
-            muscle_force_length_coeff = Function("muscle_force_length_coeff", [Q, Qdot], [muscle_force_length_coeff])(
-                q, qdot
-            )
-
-            muscle_force_velocity_coeff = (
-                muscle_force_velocity_coefficient(
-                    model=updatedModel,
-                    muscle=nlp.model.bio_model.model.muscle(muscle_idx),
-                    q=Q,
-                    qdot=Qdot,
-                )
-                if nlp.model.activate_force_velocity_relationship
-                else 1
-            )
-            muscle_force_velocity_coeff = Function(
-                "muscle_force_velocity_coeff", [Q, Qdot], [muscle_force_velocity_coeff]
-            )(q, qdot)
+            muscle_idx = muscle_model.bio_index
+
+            # The coefficient graphs are only built when their relationship is activated, a disabled
+            # relationship stays a plain 1 instead of a trivial casadi Function evaluation. Active
+            # coefficients are grouped in one Function per muscle so the kinematics are evaluated once
+            fl_activated = nlp.model.activate_force_length_relationship
+            fv_activated = nlp.model.activate_force_velocity_relationship
+            muscle_force_length_coeff = 1
+            muscle_force_velocity_coeff = 1
+            if fl_activated or fv_activated:
+                muscle = nlp.model.bio_model.model.muscle(muscle_idx)
+                coefficients = []
+                if fl_activated:
+                    coefficients.append(muscle_force_length_coefficient(model=updatedModel, muscle=muscle, q=Q))
+                if fv_activated:
+                    coefficients.append(
+                        muscle_force_velocity_coefficient(model=updatedModel, muscle=muscle, q=Q, qdot=Qdot)
+                    )
+                coefficients = Function("muscle_force_coefficients", [Q, Qdot], coefficients)(q, qdot)
+                if fl_activated and fv_activated:
+                    muscle_force_length_coeff, muscle_force_velocity_coeff = coefficients
+                elif fl_activated:
+                    muscle_force_length_coeff = coefficients
+                else:
+                    muscle_force_velocity_coeff = coefficients
 
             muscle_dxdt = muscle_model.dynamics(
                 time,
@@ -250,13 +255,13 @@ class FesMskModel(BiorbdModel):
                 force_velocity_relationship=muscle_force_velocity_coeff,
             ).dxdt
 
-            dxdt_muscle_list = vertcat(dxdt_muscle_list, muscle_dxdt)
+            dxdt_muscle_list.append(muscle_dxdt)
             muscle_idx_list.append(muscle_idx)
+            muscle_forces.append(DynamicsFunctions.get(nlp.states["F_" + muscle_model.muscle_name], states))
 
-            muscle_forces = vertcat(
-                muscle_forces,
-                DynamicsFunctions.get(nlp.states["F_" + muscle_model.muscle_name], states),
-            )
+        # One vertcat each instead of growing the expressions muscle by muscle
+        dxdt_muscle_list = vertcat(*dxdt_muscle_list)
+        muscle_forces = vertcat(*muscle_forces)
 
         muscle_moment_arm_matrix = updated_muscle_length_jacobian[
             muscle_idx_list, :
@@ -296,6 +301,13 @@ class FesMskModel(BiorbdModel):
         if self.activate_residual_torque:
             ConfigureProblem.configure_tau(ocp, nlp, as_states=False, as_controls=True)
 
+        # The state layout is frozen from here on, resolve each muscle's state indices once instead of
+        # scanning the name list per muscle in the dynamics
+        self._muscle_states_index = {
+            muscle_model.muscle_name: [i for i, name in enumerate(state_name_list) if muscle_model.muscle_name in name]
+            for muscle_model in self.muscles_dynamics_model
+        }
+
         ConfigureProblem.configure_dynamics_function(
             ocp,
             nlp,
@@ -310,17 +322,15 @@ class FesMskModel(BiorbdModel):
         activate_force_length_relationship,
         activate_force_velocity_relationship,
     ):
-        if not isinstance(muscles_model, list):
-            for muscle_model in muscles_model:
-                if not isinstance(muscle_model, FesModel):
-                    raise TypeError(
-                        f"The current model type used is {type(muscles_model)}, it must be a FesModel type."
-                        f"Current available models are: DingModelFrequency, DingModelFrequencyWithFatigue,"
-                        f"DingModelPulseWidthFrequency, DingModelPulseWidthFrequencyWithFatigue,"
-                        f"DingModelPulseIntensityFrequency, DingModelPulseIntensityFrequencyWithFatigue"
-                    )
-
-            raise TypeError("The given muscles_model must be a list of FesModel")
+        if not isinstance(muscles_model, list) or not all(
+            isinstance(muscle_model, FesModel) for muscle_model in muscles_model
+        ):
+            raise TypeError(
+                f"The current model type used is {type(muscles_model)}, it must be a list of FesModel type."
+                f"Current available models are: DingModelFrequency, DingModelFrequencyWithFatigue,"
+                f"DingModelPulseWidthFrequency, DingModelPulseWidthFrequencyWithFatigue,"
+                f"DingModelPulseIntensityFrequency, DingModelPulseIntensityFrequencyWithFatigue"
+            )
 
         if not isinstance(activate_force_length_relationship, bool):
             raise TypeError("The activate_force_length_relationship must be a boolean")
@@ -1,6 +1,6 @@
 from typing import Callable
 
-from casadi import MX, vertcat, tanh
+from casadi import MX, SX, vertcat, tanh
 import numpy as np
 
 from bioptim import (
@@ -89,6 +89,11 @@ class DingModelPulseIntensityFrequency(DingModelFrequency):
         self.cr = cr
 
     def get_lambda_i(self, nb_stim: int, pulse_intensity: MX | float) -> list[MX | float]:
+        # casadi vectors define no __len__, their entry count is carried by the shape
+        nb_intensity = pulse_intensity.shape[0] if isinstance(pulse_intensity, (MX, SX)) else len(pulse_intensity)
+        if nb_intensity == 1 and nb_stim != 1:
+            # A single intensity drives every stimulation, compute lambda once and share the node
+            return [self.lambda_i_calculation(pulse_intensity[0])] * nb_stim
         return [self.lambda_i_calculation(pulse_intensity[i]) for i in range(nb_stim)]
 
     # ---- Absolutely needed methods ---- #
@@ -263,9 +268,6 @@ class DingModelPulseIntensityFrequency(DingModelFrequency):
             intensity_parameters = model.get_intensity_parameters(nlp, parameters)
             stim_apparition = model.get_stim(nlp=nlp, parameters=parameters)
 
-            if len(intensity_parameters) == 1 and len(stim_apparition) != 1:
-                intensity_parameters = intensity_parameters * len(stim_apparition)
-
         return DynamicsEvaluation(
             dxdt=dxdt_fun(
                 cn=states[0],
@@ -51,8 +51,27 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
         self.alpha_a = ALPHA_A_DEFAULT
         self.alpha_tau1 = ALPHA_TAU1_DEFAULT
         self.tau_fat = TAU_FAT_DEFAULT
+        self._update_tau_fat_constants()
         self.alpha_km = ALPHA_KM_DEFAULT
 
+    def _update_tau_fat_constants(self):
+        # The folded inverse lets the fatigue derivatives multiply instead of divide per graph build.
+        # tau_fat can be symbolic during identification, in which case the direct division is kept.
+        if isinstance(self.tau_fat, int | float):
+            self._tau_fat_key = self.tau_fat
+            self._inv_tau_fat = 1 / self.tau_fat
+        else:
+            self._tau_fat_key = None
+            self._inv_tau_fat = None
+
+    def _get_inv_tau_fat(self) -> MX | float:
+        if isinstance(self.tau_fat, int | float):
+            if self._tau_fat_key != self.tau_fat:
+                # tau_fat was assigned directly, refresh the folded inverse
+                self._update_tau_fat_constants()
+            return self._inv_tau_fat
+        return 1 / self.tau_fat
+
     # ---- Absolutely needed methods ---- #
     @property
     def name_dof(self, with_muscle_name: bool = False) -> list[str]:
@@ -92,7 +111,7 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
         -------
         The rested values of the states Cn, F, A, Tau1, Km
         """
-        return np.array([[0], [0], [self.a_rest], [self.tau1_rest], [self.km_rest]])
+        return self._cached_rest_values(0, 0, self.a_rest, self.tau1_rest, self.km_rest)
 
     def serialize(self) -> tuple[Callable, dict]:
         # This is where you can serialize your models
@@ -190,7 +209,7 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
         -------
         The value of the derivative scaling factor (unitless)
         """
-        return -(a - self.a_rest) / self.tau_fat + self.alpha_a * f  # Equation n°5
+        return (self.a_rest - a) * self._get_inv_tau_fat() + self.alpha_a * f  # Equation n°5
 
     def tau1_dot_fun(self, tau1: MX, f: MX) -> MX | float:
         """
@@ -205,7 +224,7 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
         -------
         The value of the derivative time_state_force_no_cross_bridge (ms)
         """
-        return -(tau1 - self.tau1_rest) / self.tau_fat + self.alpha_tau1 * f  # Equation n°9
+        return (self.tau1_rest - tau1) * self._get_inv_tau_fat() + self.alpha_tau1 * f  # Equation n°9
 
     def km_dot_fun(self, km: MX, f: MX) -> MX | float:
         """
@@ -220,7 +239,7 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
         -------
         The value of the derivative cross_bridges (unitless)
         """
-        return -(km - self.km_rest) / self.tau_fat + self.alpha_km * f  # Equation n°11
+        return (self.km_rest - km) * self._get_inv_tau_fat() + self.alpha_km * f  # Equation n°11
 
     @staticmethod
     def dynamics(
@@ -276,9 +295,6 @@ class DingModelPulseIntensityFrequencyWithFatigue(DingModelPulseIntensityFrequen
             intensity_parameters = model.get_intensity_parameters(nlp, parameters)
             stim_apparition = model.get_stim(nlp=nlp, parameters=parameters)
 
-            if len(intensity_parameters) == 1 and len(stim_apparition) != 1:
-                intensity_parameters = intensity_parameters * len(stim_apparition)
-
         return DynamicsEvaluation(
             dxdt=dxdt_fun(
                 cn=states[0],
@@ -406,13 +406,14 @@ class OcpFesId(OcpFes):
 
         index_sup = 0
         index_inf = 0
-        stim_index = []
+        stim_index = range(0, 0)
         for i in range(n_shooting + additional_nodes):
             if i in stim_at_node:
                 index_sup += 1
                 if index_sup >= max_stim_to_keep:
                     index_inf = index_sup - max_stim_to_keep
-                stim_index = [i for i in range(index_inf, index_sup)]
+                # A range carries the contiguous window without materializing an index list per node
+                stim_index = range(index_inf, index_sup)
 
             constraints.add(
                 CustomConstraint.cn_sum_identification,
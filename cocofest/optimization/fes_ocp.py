@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 
 from bioptim import (
@@ -29,6 +32,90 @@ from ..models.hmed2018 import DingModelPulseIntensityFrequency
 from ..models.hmed2018_with_fatigue import DingModelPulseIntensityFrequencyWithFatigue
 from ..custom_constraints import CustomConstraint
 
+# Model families sharing the pulse width / pulse intensity handling, as tuples for the isinstance
+# fast path
+_PULSE_WIDTH_MODELS = (DingModelPulseWidthFrequency, DingModelPulseWidthFrequencyWithFatigue)
+_PULSE_INTENSITY_MODELS = (DingModelPulseIntensityFrequency, DingModelPulseIntensityFrequencyWithFatigue)
+
+# Default values of the user-facing dictionaries, built once instead of on every _fill_dict call
+_DEFAULT_PULSE_EVENT = {
+    "min": None,
+    "max": None,
+    "bimapping": False,
+    "frequency": None,
+    "round_down": False,
+    "pulse_mode": "single",
+}
+_DEFAULT_PULSE_WIDTH = {
+    "fixed": None,
+    "min": None,
+    "max": None,
+    "bimapping": False,
+}
+_DEFAULT_PULSE_INTENSITY = {
+    "fixed": None,
+    "min": None,
+    "max": None,
+    "bimapping": False,
+}
+_DEFAULT_OBJECTIVE = {
+    "force_tracking": None,
+    "end_node_tracking": None,
+    "cycling": None,
+    "custom": None,
+}
+
+
+@lru_cache(maxsize=32)
+def _compute_fourier_coefficients(time_bytes: bytes, force_bytes: bytes) -> np.ndarray:
+    """
+    The 50-harmonic Fourier fit only depends on the tracking signal, memoizing it on the raw array
+    bytes avoids refitting the same data on repeated prepare_ocp calls (e.g. identification loops).
+    """
+    time = np.frombuffer(time_bytes, dtype=np.float64)
+    force = np.frombuffer(force_bytes, dtype=np.float64)
+    return FourierSeries().compute_real_fourier_coeffs(time, force, 50)
+
+
+@lru_cache(maxsize=32)
+def _fitted_force_target(time_bytes: bytes, force_bytes: bytes, n_shooting: int) -> np.ndarray:
+    """
+    The tracking target evaluated on the shooting grid, cached like the coefficients so OCP rebuilds
+    with the same tracking data and discretization skip the trigonometric evaluation as well.
+    """
+    force_fourier_coefficient = _compute_fourier_coefficients(time_bytes, force_bytes)
+    return FourierSeries().fit_func_by_fourier_series_with_real_coeffs(
+        np.linspace(0, 1, n_shooting + 1),
+        force_fourier_coefficient,
+    )[np.newaxis, :]
+
+
+@dataclass(slots=True, frozen=True)
+class _OcpSpec:
+    """
+    The assembled pieces of a FES ocp, handed from _prepare_optimization_problem to the program
+    constructors through attribute access instead of an 18-key dict.
+    """
+
+    model: FesModel
+    dynamics: DynamicsList
+    n_shooting: int
+    final_time: int | float
+    objective_functions: ObjectiveList
+    x_init: InitialGuessList
+    x_bounds: BoundsList
+    u_bounds: BoundsList
+    u_init: InitialGuessList
+    constraints: ConstraintList
+    parameters: ParameterList
+    parameters_bounds: BoundsList
+    parameters_init: InitialGuessList
+    parameter_objectives: ParameterObjectiveList
+    use_sx: bool
+    ode_solver: OdeSolver
+    n_threads: int
+    control_type: ControlType
+
 
 class OcpFes:
     """
@@ -37,7 +124,10 @@ class OcpFes:
     """
 
     @staticmethod
-    def _prepare_optimization_problem(input_dict: dict) -> dict:
+    def _prepare_optimization_problem(input_dict: dict) -> "_OcpSpec":
+
+        # One float array shared by the parameter and constraint builders, sliced without copies
+        input_dict["stim_time"] = np.asarray(input_dict["stim_time"], dtype=np.float64)
 
         (pulse_event, pulse_width, pulse_intensity, objective) = OcpFes._fill_dict(
             input_dict["pulse_event"],
@@ -46,18 +136,19 @@ class OcpFes:
             input_dict["objective"],
         )
 
-        OcpFes._sanity_check(
-            model=input_dict["model"],
-            n_shooting=input_dict["n_shooting"],
-            final_time=input_dict["final_time"],
-            pulse_event=pulse_event,
-            pulse_width=pulse_width,
-            pulse_intensity=pulse_intensity,
-            objective=objective,
-            use_sx=input_dict["use_sx"],
-            ode_solver=input_dict["ode_solver"],
-            n_threads=input_dict["n_threads"],
-        )
+        if input_dict.get("validate", True):
+            OcpFes._sanity_check(
+                model=input_dict["model"],
+                n_shooting=input_dict["n_shooting"],
+                final_time=input_dict["final_time"],
+                pulse_event=pulse_event,
+                pulse_width=pulse_width,
+                pulse_intensity=pulse_intensity,
+                objective=objective,
+                use_sx=input_dict["use_sx"],
+                ode_solver=input_dict["ode_solver"],
+                n_threads=input_dict["n_threads"],
+            )
 
         (parameters, parameters_bounds, parameters_init, parameter_objectives) = OcpFes._build_parameters(
             model=input_dict["model"],
@@ -87,28 +178,26 @@ class OcpFes:
 
         objective_functions = OcpFes._set_objective(input_dict["n_shooting"], objective)
 
-        optimization_dict = {
-            "model": input_dict["model"],
-            "dynamics": dynamics,
-            "n_shooting": input_dict["n_shooting"],
-            "final_time": input_dict["final_time"],
-            "objective_functions": objective_functions,
-            "x_init": x_init,
-            "x_bounds": x_bounds,
-            "u_bounds": u_bounds,
-            "u_init": u_init,
-            "constraints": constraints,
-            "parameters": parameters,
-            "parameters_bounds": parameters_bounds,
-            "parameters_init": parameters_init,
-            "parameter_objectives": parameter_objectives,
-            "use_sx": input_dict["use_sx"],
-            "ode_solver": input_dict["ode_solver"],
-            "n_threads": input_dict["n_threads"],
-            "control_type": input_dict["control_type"],
-        }
-
-        return optimization_dict
+        return _OcpSpec(
+            model=input_dict["model"],
+            dynamics=dynamics,
+            n_shooting=input_dict["n_shooting"],
+            final_time=input_dict["final_time"],
+            objective_functions=objective_functions,
+            x_init=x_init,
+            x_bounds=x_bounds,
+            u_bounds=u_bounds,
+            u_init=u_init,
+            constraints=constraints,
+            parameters=parameters,
+            parameters_bounds=parameters_bounds,
+            parameters_init=parameters_init,
+            parameter_objectives=parameter_objectives,
+            use_sx=input_dict["use_sx"],
+            ode_solver=input_dict["ode_solver"],
+            n_threads=input_dict["n_threads"],
+            control_type=input_dict["control_type"],
+        )
 
     @staticmethod
     def prepare_ocp(
@@ -123,6 +212,7 @@ class OcpFes:
         ode_solver: OdeSolver = OdeSolver.RK4(n_integration_steps=1),
         control_type: ControlType = ControlType.CONSTANT,
         n_threads: int = 1,
+        validate: bool = True,
     ):
         """
         Prepares the Optimal Control Program (OCP) to be solved.
@@ -153,6 +243,9 @@ class OcpFes:
             The number of threads to use while solving (multi-threading if > 1).
         control_type : ControlType
             The type of control to use.
+        validate : bool
+            If the inputs should be sanity checked, can be disabled when the same inputs were
+            already validated (e.g. repeated builds in an identification or MPC loop).
 
         Returns
         -------
@@ -173,29 +266,30 @@ class OcpFes:
             "ode_solver": ode_solver,
             "n_threads": n_threads,
             "control_type": control_type,
+            "validate": validate,
         }
 
-        optimization_dict = OcpFes._prepare_optimization_problem(input_dict)
+        ocp_spec = OcpFes._prepare_optimization_problem(input_dict)
 
         return OptimalControlProgram(
-            bio_model=[optimization_dict["model"]],
-            dynamics=optimization_dict["dynamics"],
-            n_shooting=optimization_dict["n_shooting"],
-            phase_time=[optimization_dict["final_time"]],
-            objective_functions=optimization_dict["objective_functions"],
-            x_init=optimization_dict["x_init"],
-            x_bounds=optimization_dict["x_bounds"],
-            u_bounds=optimization_dict["u_bounds"],
-            u_init=optimization_dict["u_init"],
-            constraints=optimization_dict["constraints"],
-            parameters=optimization_dict["parameters"],
-            parameter_bounds=optimization_dict["parameters_bounds"],
-            parameter_init=optimization_dict["parameters_init"],
-            parameter_objectives=optimization_dict["parameter_objectives"],
-            control_type=optimization_dict["control_type"],
-            use_sx=optimization_dict["use_sx"],
-            ode_solver=optimization_dict["ode_solver"],
-            n_threads=optimization_dict["n_threads"],
+            bio_model=[ocp_spec.model],
+            dynamics=ocp_spec.dynamics,
+            n_shooting=ocp_spec.n_shooting,
+            phase_time=[ocp_spec.final_time],
+            objective_functions=ocp_spec.objective_functions,
+            x_init=ocp_spec.x_init,
+            x_bounds=ocp_spec.x_bounds,
+            u_bounds=ocp_spec.u_bounds,
+            u_init=ocp_spec.u_init,
+            constraints=ocp_spec.constraints,
+            parameters=ocp_spec.parameters,
+            parameter_bounds=ocp_spec.parameters_bounds,
+            parameter_init=ocp_spec.parameters_init,
+            parameter_objectives=ocp_spec.parameter_objectives,
+            control_type=ocp_spec.control_type,
+            use_sx=ocp_spec.use_sx,
+            ode_solver=ocp_spec.ode_solver,
+            n_threads=ocp_spec.n_threads,
         )
 
     @staticmethod
@@ -247,44 +341,10 @@ class OcpFes:
         Returns four dictionaries: pulse_event, pulse_width, pulse_intensity, and objective.
         Each dictionary is filled with default values for any keys that were not initially set.
         """
-        pulse_event = {} if pulse_event is None else pulse_event
-        default_pulse_event = {
-            "min": None,
-            "max": None,
-            "bimapping": False,
-            "frequency": None,
-            "round_down": False,
-            "pulse_mode": "single",
-        }
-
-        pulse_width = {} if pulse_width is None else pulse_width
-        default_pulse_width = {
-            "fixed": None,
-            "min": None,
-            "max": None,
-            "bimapping": False,
-        }
-
-        pulse_intensity = {} if pulse_intensity is None else pulse_intensity
-        default_pulse_intensity = {
-            "fixed": None,
-            "min": None,
-            "max": None,
-            "bimapping": False,
-        }
-
-        objective = {} if objective is None else objective
-        default_objective = {
-            "force_tracking": None,
-            "end_node_tracking": None,
-            "cycling": None,
-            "custom": None,
-        }
-
-        pulse_event = {**default_pulse_event, **pulse_event}
-        pulse_width = {**default_pulse_width, **pulse_width}
-        pulse_intensity = {**default_pulse_intensity, **pulse_intensity}
-        objective = {**default_objective, **objective}
+        pulse_event = _DEFAULT_PULSE_EVENT | (pulse_event or {})
+        pulse_width = _DEFAULT_PULSE_WIDTH | (pulse_width or {})
+        pulse_intensity = _DEFAULT_PULSE_INTENSITY | (pulse_intensity or {})
+        objective = _DEFAULT_OBJECTIVE | (objective or {})
 
         return pulse_event, pulse_width, pulse_intensity, objective
 
@@ -328,24 +388,24 @@ class OcpFes:
             else:
                 raise TypeError("frequency must be int or float type")
 
-        if [pulse_event["min"], pulse_event["max"]].count(None) == 1:
+        if (pulse_event["min"] is None) != (pulse_event["max"] is None):
             raise ValueError("min and max time event must be both entered or none of them in order to work")
 
         if pulse_event["bimapping"]:
             if not isinstance(pulse_event["bimapping"], bool):
                 raise TypeError("time bimapping must be bool type")
 
-        if isinstance(model, DingModelPulseWidthFrequency | DingModelPulseWidthFrequencyWithFatigue):
-            if pulse_width["fixed"] is None and [pulse_width["min"], pulse_width["max"]].count(None) != 0:
+        if isinstance(model, _PULSE_WIDTH_MODELS):
+            if pulse_width["fixed"] is None and (pulse_width["min"] is None or pulse_width["max"] is None):
                 raise ValueError("pulse width or pulse width min max bounds need to be set for this model")
-            if all([pulse_width["fixed"], pulse_width["min"], pulse_width["max"]]):
+            if pulse_width["fixed"] is not None and pulse_width["min"] is not None and pulse_width["max"] is not None:
                 raise ValueError("Either pulse width or pulse width min max bounds need to be set for this model")
 
             minimum_pulse_width = (
                 0 if model.pd0 is None else model.pd0
             )  # Set it to 0 if used for the identification process
 
-            if pulse_width["fixed"]:
+            if pulse_width["fixed"] is not None:
                 if isinstance(pulse_width["fixed"], int | float):
                     if pulse_width["fixed"] < minimum_pulse_width:
                         raise ValueError(
@@ -365,7 +425,7 @@ class OcpFes:
                 else:
                     raise TypeError("Wrong pulse_width type, only int or float accepted")
 
-            elif pulse_width["min"] and pulse_width["max"]:
+            elif pulse_width["min"] is not None and pulse_width["max"] is not None:
                 if not isinstance(pulse_width["min"], int | float) or not isinstance(pulse_width["max"], int | float):
                     raise TypeError("min and max pulse width must be int or float type")
                 if pulse_width["max"] < pulse_width["min"]:
@@ -380,15 +440,13 @@ class OcpFes:
             if not isinstance(pulse_width["bimapping"], None | bool):
                 raise NotImplementedError("If added, pulse width parameter mapping must be a bool type")
 
-        if isinstance(model, DingModelPulseIntensityFrequency | DingModelPulseIntensityFrequencyWithFatigue):
-            if pulse_intensity["fixed"] is None and [pulse_intensity["min"], pulse_intensity["max"]].count(None) != 0:
+        if isinstance(model, _PULSE_INTENSITY_MODELS):
+            if pulse_intensity["fixed"] is None and (pulse_intensity["min"] is None or pulse_intensity["max"] is None):
                 raise ValueError("Pulse intensity or pulse intensity min max bounds need to be set for this model")
-            if all(
-                [
-                    pulse_intensity["fixed"],
-                    pulse_intensity["min"],
-                    pulse_intensity["max"],
-                ]
+            if (
+                pulse_intensity["fixed"] is not None
+                and pulse_intensity["min"] is not None
+                and pulse_intensity["max"] is not None
             ):
                 raise ValueError(
                     "Either pulse intensity or pulse intensity min max bounds need to be set for this model"
@@ -399,7 +457,7 @@ class OcpFes:
                 0 if None in check_for_none_type else model.min_pulse_intensity()
             )  # Set it to 0 if used for the identification process
 
-            if pulse_intensity["fixed"]:
+            if pulse_intensity["fixed"] is not None:
                 if isinstance(pulse_intensity["fixed"], int | float):
                     if pulse_intensity["fixed"] < minimum_pulse_intensity:
                         raise ValueError(
@@ -419,7 +477,7 @@ class OcpFes:
                 else:
                     raise TypeError("pulse_intensity must be int or float type")
 
-            elif pulse_intensity["min"] and pulse_intensity["max"]:
+            elif pulse_intensity["min"] is not None and pulse_intensity["max"] is not None:
                 if not isinstance(pulse_intensity["min"], int | float) or not isinstance(
                     pulse_intensity["max"], int | float
                 ):
@@ -478,7 +536,9 @@ class OcpFes:
 
     @staticmethod
     def _build_fourier_coefficient(force_tracking):
-        return FourierSeries().compute_real_fourier_coeffs(force_tracking[0], force_tracking[1], 50)
+        time = np.asarray(force_tracking[0], dtype=np.float64)
+        force = np.asarray(force_tracking[1], dtype=np.float64)
+        return _compute_fourier_coefficients(time.tobytes(), force.tobytes()).copy()
 
     @staticmethod
     def _build_parameters(
@@ -499,19 +559,18 @@ class OcpFes:
             name="pulse_apparition_time",
             function=DingModelFrequency.set_pulse_apparition_time,
             size=len(stim_time),
-            scaling=VariableScaling("pulse_apparition_time", [1] * n_stim),
+            scaling=VariableScaling("pulse_apparition_time", np.ones(n_stim)),
         )
 
-        if pulse_event["min"] and pulse_event["max"]:
-            time_min_list = np.array([0] + list(np.cumsum([pulse_event["min"]] * (n_stim - 1))))
-            time_max_list = np.array([0] + list(np.cumsum([pulse_event["max"]] * (n_stim - 1))))
-            parameters_init["pulse_apparition_time"] = np.array(
-                [(time_max_list[i] + time_min_list[i]) / 2 for i in range(n_stim)]
-            )
+        if pulse_event["min"] is not None and pulse_event["max"] is not None:
+            # The cumulative sum of a constant step is an arithmetic progression
+            time_min_list = np.arange(n_stim) * pulse_event["min"]
+            time_max_list = np.arange(n_stim) * pulse_event["max"]
+            parameters_init["pulse_apparition_time"] = (time_min_list + time_max_list) / 2
         else:
             time_min_list = stim_time
             time_max_list = stim_time
-            parameters_init["pulse_apparition_time"] = np.array(stim_time)
+            parameters_init["pulse_apparition_time"] = np.asarray(stim_time)
 
         parameters_bounds.add(
             "pulse_apparition_time",
@@ -520,19 +579,19 @@ class OcpFes:
             interpolation=InterpolationType.CONSTANT,
         )
 
-        if pulse_event["bimapping"] and pulse_event["min"] and pulse_event["max"]:
+        if pulse_event["bimapping"] and pulse_event["min"] is not None and pulse_event["max"] is not None:
             raise NotImplementedError("Bimapping is not yet implemented for pulse event")
 
-        if isinstance(model, DingModelPulseWidthFrequency):
+        if isinstance(model, _PULSE_WIDTH_MODELS):
             if pulse_width["bimapping"]:
                 n_stim = 1
 
-            if pulse_width["fixed"]:
+            if pulse_width["fixed"] is not None:
                 parameters.add(
                     name="pulse_width",
                     function=DingModelPulseWidthFrequency.set_impulse_width,
                     size=n_stim,
-                    scaling=VariableScaling("pulse_width", [1] * n_stim),
+                    scaling=VariableScaling("pulse_width", np.ones(n_stim)),
                 )
                 if isinstance(pulse_width["fixed"], list):
                     parameters_bounds.add(
@@ -548,39 +607,37 @@ class OcpFes:
                 else:
                     parameters_bounds.add(
                         "pulse_width",
-                        min_bound=np.array([pulse_width["fixed"]] * n_stim),
-                        max_bound=np.array([pulse_width["fixed"]] * n_stim),
+                        min_bound=np.full(n_stim, pulse_width["fixed"]),
+                        max_bound=np.full(n_stim, pulse_width["fixed"]),
                         interpolation=InterpolationType.CONSTANT,
                     )
-                    parameters_init["pulse_width"] = np.array([pulse_width["fixed"]] * n_stim)
+                    parameters_init["pulse_width"] = np.full(n_stim, pulse_width["fixed"])
 
-            elif pulse_width["min"] and pulse_width["max"]:
+            elif pulse_width["min"] is not None and pulse_width["max"] is not None:
                 parameters_bounds.add(
                     "pulse_width",
                     min_bound=pulse_width["min"],
                     max_bound=pulse_width["max"],
                     interpolation=InterpolationType.CONSTANT,
                 )
-                parameters_init["pulse_width"] = np.array(
-                    [(pulse_width["min"] + pulse_width["max"]) / 2 for _ in range(n_stim)]
-                )
+                parameters_init["pulse_width"] = np.full(n_stim, (pulse_width["min"] + pulse_width["max"]) / 2)
                 parameters.add(
                     name="pulse_width",
                     function=DingModelPulseWidthFrequency.set_impulse_width,
                     size=n_stim,
-                    scaling=VariableScaling("pulse_width", [1] * n_stim),
+                    scaling=VariableScaling("pulse_width", np.ones(n_stim)),
                 )
 
-        if isinstance(model, DingModelPulseIntensityFrequency):
+        if isinstance(model, _PULSE_INTENSITY_MODELS):
             if pulse_intensity["bimapping"]:
                 n_stim = 1
 
-            if pulse_intensity["fixed"]:
+            if pulse_intensity["fixed"] is not None:
                 parameters.add(
                     name="pulse_intensity",
                     function=DingModelPulseIntensityFrequency.set_impulse_intensity,
                     size=n_stim,
-                    scaling=VariableScaling("pulse_intensity", [1] * n_stim),
+                    scaling=VariableScaling("pulse_intensity", np.ones(n_stim)),
                 )
                 if isinstance(pulse_intensity["fixed"], list):
                     parameters_bounds.add(
@@ -596,13 +653,13 @@ class OcpFes:
                 else:
                     parameters_bounds.add(
                         "pulse_intensity",
-                        min_bound=np.array([pulse_intensity["fixed"]] * n_stim),
-                        max_bound=np.array([pulse_intensity["fixed"]] * n_stim),
+                        min_bound=np.full(n_stim, pulse_intensity["fixed"]),
+                        max_bound=np.full(n_stim, pulse_intensity["fixed"]),
                         interpolation=InterpolationType.CONSTANT,
                     )
-                    parameters_init["pulse_intensity"] = np.array([pulse_intensity["fixed"]] * n_stim)
+                    parameters_init["pulse_intensity"] = np.full(n_stim, pulse_intensity["fixed"])
 
-            elif pulse_intensity["min"] and pulse_intensity["max"]:
+            elif pulse_intensity["min"] is not None and pulse_intensity["max"] is not None:
                 parameters_bounds.add(
                     "pulse_intensity",
                     min_bound=[pulse_intensity["min"]],
@@ -610,12 +667,12 @@ class OcpFes:
                     interpolation=InterpolationType.CONSTANT,
                 )
                 intensity_avg = (pulse_intensity["min"] + pulse_intensity["max"]) / 2
-                parameters_init["pulse_intensity"] = np.array([intensity_avg] * n_stim)
+                parameters_init["pulse_intensity"] = np.full(n_stim, intensity_avg)
                 parameters.add(
                     name="pulse_intensity",
                     function=DingModelPulseIntensityFrequency.set_impulse_intensity,
                     size=n_stim,
-                    scaling=VariableScaling("pulse_intensity", [1] * n_stim),
+                    scaling=VariableScaling("pulse_intensity", np.ones(n_stim)),
                 )
 
         return (parameters, parameters_bounds, parameters_init, parameter_objectives)
@@ -625,37 +682,44 @@ class OcpFes:
         constraints = ConstraintList()
 
         time_vector = np.linspace(0, final_time, n_shooting + 1)
-        stim_at_node = [np.where(stim_time[i] <= time_vector)[0][0] for i in range(len(stim_time))]
+        # One binary search per stimulation instead of a boolean scan of the time vector each,
+        # gathered in a boolean mask for O(1) membership tests in the node loop below
+        stim_at_node = np.searchsorted(time_vector, stim_time, side="left")
+        is_stim_node = np.zeros(len(time_vector), dtype=bool)
+        is_stim_node[stim_at_node] = True
         additional_nodes = 1 if control_type == ControlType.LINEAR_CONTINUOUS else 0
-        if model._sum_stim_truncation:
-            max_stim_to_keep = model._sum_stim_truncation
-        else:
-            max_stim_to_keep = 10000000
-
-        index_sup = 0
-        index_inf = 0
+        max_stim_to_keep = model._sum_stim_truncation
 
-        for i in range(n_shooting + additional_nodes):
-            if i in stim_at_node:
-                index_sup += 1
-                if index_sup >= max_stim_to_keep:
-                    index_inf = index_sup - max_stim_to_keep
+        is_pulse_width_model = isinstance(model, _PULSE_WIDTH_MODELS)
+        n_nodes = n_shooting + additional_nodes
 
-            constraints.add(
-                CustomConstraint.cn_sum,
+        # The truncation windows are cumulative counts of past stimulations, computed in one
+        # vectorized pass instead of per-node running counters
+        sup_per_node = np.cumsum(is_stim_node[:n_nodes])
+        if max_stim_to_keep:
+            inf_per_node = np.maximum(0, sup_per_node - max_stim_to_keep)
+        else:
+            # No truncation, the window always starts at the first stimulation
+            inf_per_node = np.zeros(n_nodes, dtype=np.int64)
+        # The stimulation at node 0 does not count as a "last stimulation" update
+        last_stim_per_node = sup_per_node - (sup_per_node[0] if n_nodes else 0)
+
+        # Local bindings, resolved once instead of twice per node in the loop
+        add_constraint = constraints.add
+        cn_sum = CustomConstraint.cn_sum
+        a_calculation = CustomConstraint.a_calculation
+
+        for i in range(n_nodes):
+            add_constraint(
+                cn_sum,
                 node=i,
-                stim_time=stim_time[index_inf:index_sup],
+                stim_time=stim_time[inf_per_node[i] : sup_per_node[i]],
             )
-
-        if isinstance(model, DingModelPulseWidthFrequency):
-            index = 0
-            for i in range(n_shooting + additional_nodes):
-                if i in stim_at_node and i != 0:
-                    index += 1
-                constraints.add(
-                    CustomConstraint.a_calculation,
+            if is_pulse_width_model:
+                add_constraint(
+                    a_calculation,
                     node=i,
-                    last_stim_index=index,
+                    last_stim_index=int(last_stim_per_node[i]),
                 )
 
         return constraints
@@ -687,34 +751,38 @@ class OcpFes:
         # Sets the bound for all the phases
         x_bounds = BoundsList()
         variable_bound_list = model.name_dof
-        starting_bounds, min_bounds, max_bounds = (
-            model.standard_rest_values(),
-            model.standard_rest_values(),
-            model.standard_rest_values(),
-        )
-
-        for i in range(len(variable_bound_list)):
-            if variable_bound_list[i] == "Cn" or variable_bound_list[i] == "F":
-                max_bounds[i] = 1000
-            elif variable_bound_list[i] == "Tau1" or variable_bound_list[i] == "Km":
-                max_bounds[i] = 1
-            elif variable_bound_list[i] == "A":
-                min_bounds[i] = 0
-
-        starting_bounds_min = np.concatenate((starting_bounds, min_bounds, min_bounds), axis=1)
-        starting_bounds_max = np.concatenate((starting_bounds, max_bounds, max_bounds), axis=1)
+        # One rest values array, copied only for the bounds that are mutated below
+        rest_values = model.standard_rest_values()
+        starting_bounds = rest_values
+        min_bounds = rest_values.copy()
+        max_bounds = rest_values.copy()
+
+        names = np.asarray(variable_bound_list)
+        max_bounds[np.isin(names, ("Cn", "F"))] = 1000
+        max_bounds[np.isin(names, ("Tau1", "Km"))] = 1
+        min_bounds[names == "A"] = 0
+
+        # The three segments share one preallocated array instead of being concatenated
+        starting_bounds_min = np.empty((len(variable_bound_list), 3))
+        starting_bounds_min[:, 0:1] = starting_bounds
+        starting_bounds_min[:, 1:2] = min_bounds
+        starting_bounds_min[:, 2:3] = min_bounds
+        starting_bounds_max = np.empty((len(variable_bound_list), 3))
+        starting_bounds_max[:, 0:1] = starting_bounds
+        starting_bounds_max[:, 1:2] = max_bounds
+        starting_bounds_max[:, 2:3] = max_bounds
 
         for j in range(len(variable_bound_list)):
             x_bounds.add(
                 variable_bound_list[j],
-                min_bound=np.array([starting_bounds_min[j]]),
-                max_bound=np.array([starting_bounds_max[j]]),
+                min_bound=starting_bounds_min[j : j + 1],
+                max_bound=starting_bounds_max[j : j + 1],
                 interpolation=InterpolationType.CONSTANT_WITH_FIRST_AND_LAST_DIFFERENT,
             )
 
         x_init = InitialGuessList()
         for j in range(len(variable_bound_list)):
-            x_init.add(variable_bound_list[j], model.standard_rest_values()[j])
+            x_init.add(variable_bound_list[j], rest_values[j])
 
         return x_bounds, x_init
 
@@ -726,7 +794,7 @@ class OcpFes:
         # Controls initial guess
         u_init = InitialGuessList()
         u_init.add(key="Cn_sum", initial_guess=[0], phase=0)
-        if isinstance(model, DingModelPulseWidthFrequency):
+        if isinstance(model, _PULSE_WIDTH_MODELS):
             u_init.add(key="A_calculation", initial_guess=[0], phase=0)
 
         return u_bounds, u_init
@@ -740,15 +808,9 @@ class OcpFes:
                 objective_functions.add(objective["custom"][0][i])
 
         if objective["force_tracking"]:
-            force_fourier_coefficient = (
-                None
-                if objective["force_tracking"] is None
-                else OcpFes._build_fourier_coefficient(objective["force_tracking"])
-            )
-            force_to_track = FourierSeries().fit_func_by_fourier_series_with_real_coeffs(
-                np.linspace(0, 1, n_shooting + 1),
-                force_fourier_coefficient,
-            )[np.newaxis, :]
+            time = np.asarray(objective["force_tracking"][0], dtype=np.float64)
+            force = np.asarray(objective["force_tracking"][1], dtype=np.float64)
+            force_to_track = _fitted_force_target(time.tobytes(), force.tobytes(), n_shooting).copy()
 
             objective_functions.add(
                 ObjectiveFcn.Lagrange.TRACK_STATE,
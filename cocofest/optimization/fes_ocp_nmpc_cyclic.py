@@ -59,25 +59,25 @@ class NmpcFes(CyclicNonlinearModelPredictiveControl):
             "control_type": control_type,
         }
 
-        optimization_dict = OcpFes._prepare_optimization_problem(input_dict)
+        ocp_spec = OcpFes._prepare_optimization_problem(input_dict)
 
         return NmpcFes(
-            bio_model=[optimization_dict["model"]],
-            dynamics=optimization_dict["dynamics"],
-            cycle_len=optimization_dict["n_shooting"],
+            bio_model=[ocp_spec.model],
+            dynamics=ocp_spec.dynamics,
+            cycle_len=ocp_spec.n_shooting,
             cycle_duration=cycle_duration,
             n_cycles_simultaneous=n_cycles_simultaneous,
             n_cycles_to_advance=n_cycles_to_advance,
-            common_objective_functions=optimization_dict["objective_functions"],
-            x_init=optimization_dict["x_init"],
-            x_bounds=optimization_dict["x_bounds"],
-            constraints=optimization_dict["constraints"],
-            parameters=optimization_dict["parameters"],
-            parameter_bounds=optimization_dict["parameters_bounds"],
-            parameter_init=optimization_dict["parameters_init"],
-            parameter_objectives=optimization_dict["parameter_objectives"],
+            common_objective_functions=ocp_spec.objective_functions,
+            x_init=ocp_spec.x_init,
+            x_bounds=ocp_spec.x_bounds,
+            constraints=ocp_spec.constraints,
+            parameters=ocp_spec.parameters,
+            parameter_bounds=ocp_spec.parameters_bounds,
+            parameter_init=ocp_spec.parameters_init,
+            parameter_objectives=ocp_spec.parameter_objectives,
             control_type=control_type,
-            use_sx=optimization_dict["use_sx"],
-            ode_solver=optimization_dict["ode_solver"],
-            n_threads=optimization_dict["n_threads"],
+            use_sx=ocp_spec.use_sx,
+            ode_solver=ocp_spec.ode_solver,
+            n_threads=ocp_spec.n_threads,
         )
@@ -293,3 +293,25 @@ def test_all_ivp_errors():
             },
             ivp_parameters={"final_time": 0.3, "n_threads": None},
         )
+
+    with pytest.raises(ValueError, match="expand_dynamics must be a bool type"):
+        IvpFes(
+            fes_parameters={
+                "model": ding2003_model,
+                "stim_time": [0, 0.1, 0.2],
+            },
+            ivp_parameters={"final_time": 0.3, "expand_dynamics": None},
+        )
+
+
+def test_ivp_skips_validation_when_already_validated(monkeypatch):
+    def _fail(self):
+        raise AssertionError("dictionaries_check should not be called when _validated=True")
+
+    monkeypatch.setattr(IvpFes, "dictionaries_check", _fail)
+    ivp = IvpFes(
+        fes_parameters={"model": ding2003_model, "stim_time": [0, 0.1, 0.2]},
+        ivp_parameters={"final_time": 0.3},
+        _validated=True,
+    )
+    assert ivp.n_stim == 3
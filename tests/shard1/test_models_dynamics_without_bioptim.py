@@ -156,6 +156,32 @@ def test_ding2007_dynamics():
         np.array(model.a_calculation(a_scale=4920, t=0, t_stim_prev=[0.1], pulse_width=[0.0002])).squeeze(),
         np.array(DM(1464.4646488)).squeeze(),
     )
+    # Two stimulations, before and after the second one
+    np.testing.assert_almost_equal(
+        np.array(
+            model.a_calculation(a_scale=4920, t=0.05, t_stim_prev=[0, 0.1], pulse_width=[0.0002, 0.0004])
+        ).squeeze(),
+        np.array(DM(1464.4646488)).squeeze(),
+    )
+    np.testing.assert_almost_equal(
+        np.array(
+            model.a_calculation(a_scale=4920, t=0.15, t_stim_prev=[0, 0.1], pulse_width=[0.0002, 0.0004])
+        ).squeeze(),
+        np.array(DM(3686.5903851)).squeeze(),
+    )
+    # Three stimulations, the most recent pulse width is selected
+    np.testing.assert_almost_equal(
+        np.array(
+            model.a_calculation(a_scale=4920, t=0.15, t_stim_prev=[0, 0.1, 0.2], pulse_width=[0.0002, 0.0004, 0.0006])
+        ).squeeze(),
+        np.array(DM(3686.5903851)).squeeze(),
+    )
+    np.testing.assert_almost_equal(
+        np.array(
+            model.a_calculation(a_scale=4920, t=0.25, t_stim_prev=[0, 0.1, 0.2], pulse_width=[0.0002, 0.0004, 0.0006])
+        ).squeeze(),
+        np.array(DM(4479.7500464)).squeeze(),
+    )
 
 
 def test_hmed2018_dynamics():
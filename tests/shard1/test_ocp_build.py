@@ -426,6 +426,31 @@ def test_ding2007_build():
     )
 
 
+def test_ding2007_build_without_validation():
+    # The sanity check rejects setting both the fixed and the min/max pulse width; validate=False skips
+    # the check and the fixed value takes precedence
+    min_width = ding2007.pd0
+    with pytest.raises(
+        ValueError,
+        match="Either pulse width or pulse width min max bounds need to be set for this model",
+    ):
+        OcpFes().prepare_ocp(
+            model=ding2007,
+            stim_time=[0],
+            final_time=0.1,
+            pulse_width={"fixed": 0.003, "min": min_width, "max": 0.005},
+            use_sx=True,
+        )
+    ocp = OcpFes().prepare_ocp(
+        model=ding2007,
+        stim_time=[0],
+        final_time=0.1,
+        pulse_width={"fixed": 0.003, "min": min_width, "max": 0.005},
+        use_sx=True,
+        validate=False,
+    )
+
+
 def test_hmed2018_build():
     objective_list = ObjectiveList()
     objective_list.add(
@@ -623,3 +623,19 @@ def test_all_id_program_errors():
         )
 
     additional_key_settings = {}
+
+    ipopt_options = "test"
+    with pytest.raises(
+        TypeError,
+        match=re.escape(
+            f"The given ipopt_options must be dict type," f" the given value is {type(ipopt_options)} type"
+        ),
+    ):
+        DingModelFrequencyForceParameterIdentification(
+            model=ding2003,
+            identification_method=identification_method,
+            data_path=data_path,
+            key_parameter_to_identify=key_parameter_to_identify,
+            additional_key_settings=additional_key_settings,
+            ipopt_options=ipopt_options,
+        )